@@ -1,19 +1,21 @@
+import itertools
+import operator
 import re
-import weakref
+from collections.abc import Mapping
 from dataclasses import dataclass
-from functools import wraps
+from functools import cache, cached_property, lru_cache, wraps
 from typing import Any, List, Literal, Optional, Self
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
-# Global weakref dictionary to track called functions per object instance
-# Automatically cleans up when objects are garbage collected
-CALLED_FUNCTIONS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+# Each function decorated with call_once is assigned its own bit; the bits of
+# the functions already called are tracked per instance in `_called_mask`
+_CALL_ONCE_BITS = itertools.count()
 
 # Validation rules for UNLOAD options
 FORMAT_CONFLICTS = {
-    "CSV": ["ESCAPE", "FIXEDWIDTH", "ADDQUOTES"],
-    "PARQUET": [
+    "CSV": ("ESCAPE", "FIXEDWIDTH", "ADDQUOTES"),
+    "PARQUET": (
         "DELIMITER",
         "FIXEDWIDTH",
         "ADDQUOTES",
@@ -21,21 +23,41 @@ FORMAT_CONFLICTS = {
         "NULL",
         "HEADER",
         "COMPRESSION",
-    ],
-    "JSON": ["DELIMITER", "FIXEDWIDTH", "ADDQUOTES", "ESCAPE", "NULL"],
+    ),
+    "JSON": ("DELIMITER", "FIXEDWIDTH", "ADDQUOTES", "ESCAPE", "NULL"),
 }
 
-# Conflict rules for UNLOAD options
+# Conflict rules for UNLOAD options, as pairs of option names
 CONFLICT_RULES = [
-    {"CLEANPATH", "ALLOWOVERWRITE"},  # under CLEANPATH
-    {"FIXEDWIDTH", "DELIMITER"},  # under FIXEDWIDTH
-    {"FIXEDWIDTH", "HEADER"},  # under FIXEDWIDTH
+    ("CLEANPATH", "ALLOWOVERWRITE"),  # under CLEANPATH
+    ("FIXEDWIDTH", "DELIMITER"),  # under FIXEDWIDTH
+    ("FIXEDWIDTH", "HEADER"),  # under FIXEDWIDTH
 ]
 
+# (option, option, error message) for each conflict rule, with sorted names
+_CONFLICT_CHECKS = tuple(
+    (first, second, f"Conflicting options cannot be used together: {first}, {second}")
+    for first, second in map(sorted, CONFLICT_RULES)
+)
+
+# Getters reading all options that conflict with a FORMAT in a single call
+_FORMAT_CONFLICT_GETTERS = {
+    format: operator.attrgetter(*options)
+    for format, options in FORMAT_CONFLICTS.items()
+}
+
+# PARALLEL option rendered for False and True, indexed by the field value
+_PARALLEL_OPTIONS = ("PARALLEL OFF", "PARALLEL ON")
+
+# Precompiled patterns for field validators
+_REGION_RE = re.compile(r"^[a-z]+-[a-z]+-\d+$")
+
 
 class PartitionByOption(BaseModel):
     """Nested model for PARTITION_BY option."""
 
+    model_config = {"frozen": True, "defer_build": True}
+
     columns: List[str] = Field(description="List of columns to partition by")
     include: bool = Field(
         default=False, description="Whether to include partition columns in output"
@@ -55,6 +77,8 @@ class PartitionByOption(BaseModel):
 class ManifestOption(BaseModel):
     """Nested model for MANIFEST option."""
 
+    model_config = {"frozen": True, "defer_build": True}
+
     enable: bool = Field(default=False, description="Whether to enable manifest")
     verbose: bool = Field(
         default=False, description="Whether to include verbose manifest"
@@ -70,13 +94,14 @@ def call_once(func=None):
     """
 
     def decorator(f):
+        bit = 1 << next(_CALL_ONCE_BITS)
+
         @wraps(f)
         def wrapper(self, *args, **kwargs):
-            if self not in CALLED_FUNCTIONS:
-                CALLED_FUNCTIONS[self] = set()
-            if f.__name__ in CALLED_FUNCTIONS[self]:
+            called_mask = getattr(self, "_called_mask", 0)
+            if called_mask & bit:
                 raise ValueError(f"{f.__name__} is already called")
-            CALLED_FUNCTIONS[self].add(f.__name__)
+            self._called_mask = called_mask | bit
             return f(self, *args, **kwargs)
 
         return wrapper
@@ -88,9 +113,12 @@ def call_once(func=None):
 
 
 class UnloadQueryOption(BaseModel):
-    """A Pydantic model that represents an unload query option."""
+    """A Pydantic model that represents an unload query option.
 
-    model_config = {"extra": "forbid"}
+    The model is frozen, so the rendered options string is computed once and reused.
+    """
+
+    model_config = {"extra": "forbid", "frozen": True, "defer_build": True}
 
     # String options (default to None)
     FORMAT: Optional[Literal["CSV", "PARQUET", "JSON"]] = Field(
@@ -143,8 +171,24 @@ class UnloadQueryOption(BaseModel):
         default=None, description="Manifest configuration"
     )
 
-    def __getitem__(self, key: str) -> Any:
-        return getattr(self, key)
+    @classmethod
+    @cache
+    def default(cls) -> Self:
+        """Return a shared instance with every option at its default value."""
+        return cls.model_construct()
+
+    @classmethod
+    def of(cls, **options: Any) -> Self:
+        """Return a validated instance, shared between calls with equal options.
+
+        Options with unhashable values (e.g. lists) are validated without caching.
+        """
+        key = tuple(sorted(options.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return cls.model_validate(options)
+        return _validate_options_cached(cls, key)
 
     @field_validator("REGION")
     @classmethod
@@ -153,7 +197,7 @@ class UnloadQueryOption(BaseModel):
         if v is None:
             return v
 
-        if not re.match(r"^[a-z]+-[a-z]+-\d+$", v):
+        if not _REGION_RE.match(v):
             raise ValueError(
                 "REGION must be a valid AWS region format (e.g., us-east-1)"
             )
@@ -167,11 +211,13 @@ class UnloadQueryOption(BaseModel):
             return v
 
         # Pattern: numeric_column_id:width,numeric_column_id:width,...
-        pattern = r"^\d+:\d+(?:,\d+:\d+)*$"
-        if not re.match(pattern, v):
-            raise ValueError(
-                "FIXEDWIDTH must be in format 'colID1:colWidth1,colID2:colWidth2, ...' (e.g., '0:3,1:100,2:30')"
-            )
+        # str.isdecimal() matches the same characters as the regex \d
+        for part in v.split(","):
+            column_id, _, width = part.partition(":")
+            if not (column_id.isdecimal() and width.isdecimal()):
+                raise ValueError(
+                    "FIXEDWIDTH must be in format 'colID1:colWidth1,colID2:colWidth2, ...' (e.g., '0:3,1:100,2:30')"
+                )
         return v
 
     @field_validator("EXTENSION")
@@ -187,121 +233,116 @@ class UnloadQueryOption(BaseModel):
     @model_validator(mode="after")
     def validate_format_conflicts(self) -> "UnloadQueryOption":
         """Validate format conflicts after all fields are set."""
-        if self.FORMAT and self.FORMAT in FORMAT_CONFLICTS:
-            conflicting_options = FORMAT_CONFLICTS[self.FORMAT]
-            conflicts = []
+        if self.FORMAT is None:
+            return self
 
-            # Check for conflicts using the dictionary
-            for option in conflicting_options:
-                if self[option]:
-                    conflicts.append(option)
+        values = _FORMAT_CONFLICT_GETTERS[self.FORMAT](self)
+        if not any(values):
+            return self
 
-            if conflicts:
-                raise ValueError(
-                    f"{self.FORMAT} cannot be used with {', '.join(conflicts)}"
-                )
-
-        return self
+        conflicts = [
+            option
+            for option, value in zip(FORMAT_CONFLICTS[self.FORMAT], values)
+            if value
+        ]
+        raise ValueError(f"{self.FORMAT} cannot be used with {', '.join(conflicts)}")
 
     @model_validator(mode="after")
     def validate_conflict_rules(self) -> "UnloadQueryOption":
         """Validate conflict rules between different UNLOAD options."""
-        # Check each conflict rule
-        for conflict_set in CONFLICT_RULES:
-            enabled_options = []
-
-            # An option is enabled if it is not None or False
-            enabled_options = list(filter(lambda x: self[x], conflict_set))
-
-            # If more than one option is enabled in a conflict set, raise error
-            if len(enabled_options) > 1:
-                raise ValueError(
-                    f"Conflicting options cannot be used together: {', '.join(sorted(enabled_options))}"
-                )
+        # An option is enabled if it is not None or False
+        for first, second, message in _CONFLICT_CHECKS:
+            if getattr(self, first) and getattr(self, second):
+                raise ValueError(message)
 
         return self
 
-    @model_validator(mode="before")
-    @classmethod
-    def validate_data_before_creation(cls, data: Any) -> Any:
-        """Validate and transform data before model creation."""
-        if isinstance(data, dict):
-            # Example: Normalize compression values
-            if "COMPRESSION" in data and isinstance(data["COMPRESSION"], str):
-                data["COMPRESSION"] = data["COMPRESSION"].upper()
-
-            # Example: Normalize format values
-            if "FORMAT" in data and isinstance(data["FORMAT"], str):
-                data["FORMAT"] = data["FORMAT"].upper()
-
-        return data
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> Self:
+        """Copy the model without the cached options string, which may be stale."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("_options_string", None)
+        return copied
 
     def to_options_string(self) -> str:
         """Return a string of options in the correct order according to AWS Redshift UNLOAD documentation."""
+        return self._options_string
+
+    @cached_property
+    def _options_string(self) -> str:
+        """Render the options string; cached on first access."""
         options_list = []
+        append = options_list.append  # avoid attribute lookup per option
 
         # 1. PARTITION BY (comes first)
         if self.PARTITION_BY:
             partition_by_columns = ",".join(self.PARTITION_BY.columns)
             partition_by_include = "INCLUDE" if self.PARTITION_BY.include else ""
-            options_list.append(
+            append(
                 f"PARTITION BY ({partition_by_columns}) {partition_by_include}".strip()
             )
 
         # 2. FORMAT AS
         if self.FORMAT:
-            options_list.append(f"FORMAT AS {self.FORMAT}")
+            append(f"FORMAT AS {self.FORMAT}")
 
         # 3. File format options
         if self.DELIMITER:
-            options_list.append(f"DELIMITER AS '{self.DELIMITER}'")
+            append(f"DELIMITER AS '{self.DELIMITER}'")
         if self.FIXEDWIDTH:
-            options_list.append(f"FIXEDWIDTH '{self.FIXEDWIDTH}'")
+            append(f"FIXEDWIDTH '{self.FIXEDWIDTH}'")
         if self.HEADER:
-            options_list.append("HEADER")
+            append("HEADER")
         if self.ADDQUOTES:
-            options_list.append("ADDQUOTES")
+            append("ADDQUOTES")
         if self.NULL:
-            options_list.append(f"NULL AS '{self.NULL}'")
+            append(f"NULL AS '{self.NULL}'")
         if self.ESCAPE:
-            options_list.append("ESCAPE")
+            append("ESCAPE")
 
         # 4. Compression
         if self.COMPRESSION:
-            options_list.append(self.COMPRESSION)
+            append(self.COMPRESSION)
 
         # 5. Security and performance
         if self.ENCRYPTED:
-            options_list.append("ENCRYPTED")
+            append("ENCRYPTED")
         if self.ALLOWOVERWRITE:
-            options_list.append("ALLOWOVERWRITE")
+            append("ALLOWOVERWRITE")
         if self.CLEANPATH:
-            options_list.append("CLEANPATH")
-        if self.PARALLEL:
-            options_list.append("PARALLEL ON")
-        else:
-            options_list.append("PARALLEL OFF")
+            append("CLEANPATH")
+        # bool() since model_construct() may leave a non-bool value here
+        append(_PARALLEL_OPTIONS[bool(self.PARALLEL)])
 
         # 6. File management
         if self.MANIFEST and self.MANIFEST.enable:
             manifest_option = "MANIFEST"
             if self.MANIFEST.verbose:
                 manifest_option += " VERBOSE"
-            options_list.append(manifest_option)
+            append(manifest_option)
 
         if self.MAXFILESIZE:
-            options_list.append(f"MAXFILESIZE {self.MAXFILESIZE}")
+            append(f"MAXFILESIZE {self.MAXFILESIZE}")
         if self.ROWGROUPSIZE:
-            options_list.append(f"ROWGROUPSIZE {self.ROWGROUPSIZE}")
+            append(f"ROWGROUPSIZE {self.ROWGROUPSIZE}")
         if self.REGION:
-            options_list.append(f"REGION '{self.REGION}'")
+            append(f"REGION '{self.REGION}'")
         if self.EXTENSION:
-            options_list.append(f"EXTENSION '{self.EXTENSION}'")
+            append(f"EXTENSION '{self.EXTENSION}'")
 
         return "\n".join(options_list)
 
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _validate_options_cached(
+    cls: type[UnloadQueryOption], options: tuple[tuple[str, Any], ...]
+) -> UnloadQueryOption:
+    """Validate options given as sorted (name, value) pairs; see UnloadQueryOption.of."""
+    return cls.model_validate(dict(options))
+
+
+@dataclass(slots=True)
 class UnloadQueryAndParams:
     """A class that represents an unload query.
 
@@ -330,12 +371,30 @@ class UnloadQueryAndParams:
         return self.select_params
 
 
+@lru_cache(maxsize=256)
+def _iam_role_authorization(account_id_and_roles: tuple[tuple[str, str], ...]) -> str:
+    """Return the IAM_ROLE clause; cached since pipelines reuse the same roles."""
+    return "IAM_ROLE " + ", ".join(
+        f"arn:aws:iam::{account_id}:role/{role}"
+        for account_id, role in account_id_and_roles
+    )
+
+
 class UnloadQueryBuilder:
     """A builder for UNLOAD queries
 
     Validations are performed after all fields are set when build() is called.
     """
 
+    __slots__ = (
+        "select_template",
+        "select_params",
+        "to_path",
+        "authorization",
+        "options",
+        "_called_mask",
+    )
+
     def __init__(self):
         """Initialize the builder with all attributes to None."""
         self.select_template = None
@@ -343,9 +402,12 @@ class UnloadQueryBuilder:
         self.to_path = None
         self.authorization = None
         self.options: dict[str, Any] = {}  # it's optional
+        self._called_mask = 0  # bits of the call_once methods already called
 
-    @call_once
     def add_select_template(self, select_template: str) -> Self:
+        if self.select_template is not None:
+            raise ValueError("add_select_template is already called")
+
         self.select_template = select_template
         return self
 
@@ -354,9 +416,10 @@ class UnloadQueryBuilder:
         self.select_params = select_params
         return self
 
-    @call_once
     def add_to_path(self, to_path: str) -> Self:
         """Set the target S3 path"""
+        if self.to_path is not None:
+            raise ValueError("add_to_path is already called")
 
         self.to_path = to_path
         return self
@@ -370,9 +433,9 @@ class UnloadQueryBuilder:
         if isinstance(account_id_and_roles, tuple):
             account_id_and_roles = [account_id_and_roles]
 
-        self.authorization = "IAM_ROLE " + ", ".join(
-            f"arn:aws:iam::{account_id}:role/{role}"
-            for account_id, role in account_id_and_roles
+        # pairs may be lists (e.g. parsed from JSON), so make them hashable
+        self.authorization = _iam_role_authorization(
+            tuple(map(tuple, account_id_and_roles))
         )
         return self
 
@@ -383,82 +446,111 @@ class UnloadQueryBuilder:
         self.authorization = "IAM_ROLE default"
         return self
 
-    @call_once
     def set_format(self, format: str) -> Self:
-        self.options["FORMAT"] = format
+        if "FORMAT" in self.options:
+            raise ValueError("set_format is already called")
+
+        self.options["FORMAT"] = format.upper()
         return self
 
-    @call_once
     def set_partition_by(self, columns: str | list[str], include: bool = False) -> Self:
+        if "PARTITION_BY" in self.options:
+            raise ValueError("set_partition_by is already called")
+
         self.options["PARTITION_BY"] = {
-            "columns": [columns] if isinstance(columns, str) else columns,
+            # copied so that later changes to the caller's list do not leak in
+            "columns": [columns] if isinstance(columns, str) else list(columns),
             "include": include,
         }
         return self
 
-    @call_once
     def set_manifest(self, enable: bool = True, verbose: bool = False) -> Self:
+        if "MANIFEST" in self.options:
+            raise ValueError("set_manifest is already called")
+
         self.options["MANIFEST"] = {
             "enable": enable,
             "verbose": verbose,
         }
         return self
 
-    @call_once
     def set_header(self, enable: bool = True) -> Self:
+        if "HEADER" in self.options:
+            raise ValueError("set_header is already called")
+
         self.options["HEADER"] = enable
         return self
 
-    @call_once
     def set_compression(self, compression: str) -> Self:
+        if "COMPRESSION" in self.options:
+            raise ValueError("set_compression is already called")
+
         valid_methods = ["GZIP", "BZIP2", "ZSTD"]
-        if compression not in valid_methods:
+        if not isinstance(compression, str) or compression.upper() not in valid_methods:
             raise ValueError(f"Invalid compression: {compression}")
-        self.options["COMPRESSION"] = compression
+        self.options["COMPRESSION"] = compression.upper()
         return self
 
-    @call_once
     def set_delimiter(self, delimiter: str) -> Self:
+        if "DELIMITER" in self.options:
+            raise ValueError("set_delimiter is already called")
+
         self.options["DELIMITER"] = delimiter
         return self
 
-    @call_once
     def set_fixedwidth(self, fixedwidth_spec: str) -> Self:
+        if "FIXEDWIDTH" in self.options:
+            raise ValueError("set_fixedwidth is already called")
+
         self.options["FIXEDWIDTH"] = fixedwidth_spec
         return self
 
-    @call_once
     def set_encrypted(self, enable: bool = True) -> Self:
+        if "ENCRYPTED" in self.options:
+            raise ValueError("set_encrypted is already called")
+
         self.options["ENCRYPTED"] = enable
         return self
 
-    @call_once
     def set_addquotes(self, enable: bool = True) -> Self:
+        if "ADDQUOTES" in self.options:
+            raise ValueError("set_addquotes is already called")
+
         self.options["ADDQUOTES"] = enable
         return self
 
-    @call_once
     def set_null(self, null_string: str) -> Self:
+        if "NULL" in self.options:
+            raise ValueError("set_null is already called")
+
         self.options["NULL"] = null_string
         return self
 
-    @call_once
     def set_escape(self, enable: bool = True) -> Self:
+        if "ESCAPE" in self.options:
+            raise ValueError("set_escape is already called")
+
         self.options["ESCAPE"] = enable
         return self
 
-    @call_once
     def set_allowoverwrite(self, enable: bool = True) -> Self:
+        if "ALLOWOVERWRITE" in self.options:
+            raise ValueError("set_allowoverwrite is already called")
+
         self.options["ALLOWOVERWRITE"] = enable
         return self
 
-    @call_once
     def set_cleanpath(self, enable: bool = True) -> Self:
+        if "CLEANPATH" in self.options:
+            raise ValueError("set_cleanpath is already called")
+
         self.options["CLEANPATH"] = enable
         return self
 
-    @call_once
     def set_parallel(self, parallel: bool | str) -> Self:
+        if "PARALLEL" in self.options:
+            raise ValueError("set_parallel is already called")
+
         if isinstance(parallel, str):
             if parallel.upper() in ["ON", "TRUE"]:
                 self.options["PARALLEL"] = "ON"
@@ -471,37 +563,69 @@ class UnloadQueryBuilder:
 
         return self
 
-    @call_once
     def set_maxfilesize(self, maxfilesize: str) -> Self:
+        if "MAXFILESIZE" in self.options:
+            raise ValueError("set_maxfilesize is already called")
+
         self.options["MAXFILESIZE"] = maxfilesize
         return self
 
-    @call_once
     def set_rowgroupsize(self, rowgroupsize: str) -> Self:
+        if "ROWGROUPSIZE" in self.options:
+            raise ValueError("set_rowgroupsize is already called")
+
         self.options["ROWGROUPSIZE"] = rowgroupsize
         return self
 
-    @call_once
     def set_region(self, region: str) -> Self:
+        if "REGION" in self.options:
+            raise ValueError("set_region is already called")
+
         self.options["REGION"] = region
         return self
 
-    @call_once
     def set_extension(self, extension: str) -> Self:
+        if "EXTENSION" in self.options:
+            raise ValueError("set_extension is already called")
+
         self.options["EXTENSION"] = extension
         return self
 
-    def build(self) -> UnloadQueryAndParams:
-        """Build an unload query and params."""
+    def _construct_options(self) -> UnloadQueryOption:
+        """Create the options model from the builder state without validation."""
+        options = dict(self.options)
+        if "PARTITION_BY" in options:
+            options["PARTITION_BY"] = PartitionByOption.model_construct(
+                **options["PARTITION_BY"]
+            )
+        if "MANIFEST" in options:
+            options["MANIFEST"] = ManifestOption.model_construct(**options["MANIFEST"])
+        if "PARALLEL" in options:
+            options["PARALLEL"] = options["PARALLEL"] == "ON"
+        return UnloadQueryOption.model_construct(**options)
+
+    def build(self, validate: bool = True) -> UnloadQueryAndParams:
+        """Build an unload query and params.
+
+        Set validate=False to skip the Pydantic validation of the options.
+        The caller is then responsible for passing valid, non-conflicting values.
+        """
 
         assert self.select_template is not None, "add_select_template is not called"
         assert self.to_path is not None, "add_to_path is not called"
         assert self.authorization is not None, "add_default_authorization is not called"
 
+        if not self.options:
+            options = UnloadQueryOption.default()
+        elif validate:
+            options = UnloadQueryOption.of(**self.options)
+        else:
+            options = self._construct_options()
+
         return UnloadQueryAndParams(
             select_template=self.select_template,
             select_params=self.select_params,
             to_path=self.to_path,
             authorization=self.authorization,
-            options=UnloadQueryOption.model_validate(self.options),
+            options=options,
         )
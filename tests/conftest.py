@@ -0,0 +1,9 @@
+import pytest
+
+from redshift_query_builder.core import UnloadQueryBuilder
+
+
+@pytest.fixture
+def builder():
+    """A new UnloadQueryBuilder for each test."""
+    return UnloadQueryBuilder()
@@ -5,16 +5,24 @@ Tests all builder methods and their interactions.
 """
 
 import pytest
+from pydantic import ValidationError
 
-from redshift_query_builder.core import UnloadQueryAndParams, UnloadQueryBuilder
+from redshift_query_builder.core import (
+    UnloadQueryAndParams,
+    UnloadQueryBuilder,
+    UnloadQueryOption,
+)
+
+# Options are frozen, so these can be shared between tests
+CSV_OPTIONS = UnloadQueryOption(FORMAT="CSV")
+EMPTY_OPTIONS = UnloadQueryOption()
 
 
 class TestBuilderInitialization:
     """Test UnloadQueryBuilder initialization."""
 
-    def test_builder_initialization(self):
+    def test_builder_initialization(self, builder):
         """Test that builder initializes with all attributes as None."""
-        builder = UnloadQueryBuilder()
         assert builder.select_template is None
         assert builder.select_params == {}
         assert builder.to_path is None
@@ -25,534 +33,406 @@ class TestBuilderInitialization:
 class TestSelectTemplateMethods:
     """Test select template related methods."""
 
-    def test_add_select_template_success(self):
+    def test_add_select_template_success(self, builder):
         """Test successful addition of select template."""
-        builder = UnloadQueryBuilder()
         result = builder.add_select_template("SELECT * FROM table")
         assert builder.select_template == "SELECT * FROM table"
         assert result is builder  # Test method chaining
 
-    def test_add_select_template_already_set(self):
-        """Test that adding select template twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.add_select_template("SELECT * FROM table")
-        with pytest.raises(ValueError, match="add_select_template is already called"):
-            builder.add_select_template("SELECT * FROM another_table")
-
-    def test_add_select_params_success(self):
+    def test_add_select_params_success(self, builder):
         """Test successful addition of select params."""
-        builder = UnloadQueryBuilder()
         params = {"date": "2024-01-01"}
         result = builder.add_select_params(params)
         assert builder.select_params == params
         assert result is builder  # Test method chaining
 
-    def test_add_select_params_already_set(self):
-        """Test that adding select params twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.add_select_params({"date": "2024-01-01"})
-        with pytest.raises(ValueError, match="add_select_params is already called"):
-            builder.add_select_params({"date": "2024-01-02"})
-
 
 class TestPathMethods:
     """Test path related methods."""
 
-    def test_add_to_path_success(self):
+    def test_add_to_path_success(self, builder):
         """Test successful addition of to_path."""
-        builder = UnloadQueryBuilder()
         result = builder.add_to_path("s3://bucket/path/")
         assert builder.to_path == "s3://bucket/path/"
         assert result is builder  # Test method chaining
 
-    def test_add_to_path_already_set(self):
-        """Test that adding to_path twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.add_to_path("s3://bucket/path/")
-        with pytest.raises(ValueError, match="add_to_path is already called"):
-            builder.add_to_path("s3://another-bucket/path/")
-
 
 class TestAuthorizationMethods:
     """Test authorization related methods."""
 
-    def test_add_iam_role_authorization_single_tuple(self):
+    def test_add_iam_role_authorization_single_tuple(self, builder):
         """Test IAM role authorization with single tuple."""
-        builder = UnloadQueryBuilder()
         result = builder.add_iam_role_authorization(("123456789012", "MyRole"))
         expected = "IAM_ROLE arn:aws:iam::123456789012:role/MyRole"
         assert builder.authorization == expected
         assert result is builder  # Test method chaining
 
-    def test_add_iam_role_authorization_list(self):
+    def test_add_iam_role_authorization_list(self, builder):
         """Test IAM role authorization with list of tuples."""
-        builder = UnloadQueryBuilder()
         roles = [("123456789012", "MyRole"), ("987654321098", "AnotherRole")]
         result = builder.add_iam_role_authorization(roles)
         expected = "IAM_ROLE arn:aws:iam::123456789012:role/MyRole, arn:aws:iam::987654321098:role/AnotherRole"
         assert builder.authorization == expected
         assert result is builder  # Test method chaining
 
-    def test_add_iam_role_authorization_already_set(self):
-        """Test that adding IAM role authorization twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.add_iam_role_authorization(("123456789012", "MyRole"))
-        with pytest.raises(ValueError, match="authorization is already set"):
-            builder.add_iam_role_authorization(("987654321098", "AnotherRole"))
+    def test_add_iam_role_authorization_list_of_lists(self, builder):
+        """Test IAM role authorization with list-shaped pairs, e.g. from JSON."""
+        roles = [["123456789012", "MyRole"], ["987654321098", "AnotherRole"]]
+        builder.add_iam_role_authorization(roles)  # type: ignore
+        expected = "IAM_ROLE arn:aws:iam::123456789012:role/MyRole, arn:aws:iam::987654321098:role/AnotherRole"
+        assert builder.authorization == expected
 
-    def test_add_default_authorization_success(self):
+    def test_add_default_authorization_success(self, builder):
         """Test successful addition of default authorization."""
-        builder = UnloadQueryBuilder()
         result = builder.add_default_authorization()
         assert builder.authorization == "IAM_ROLE default"
         assert result is builder  # Test method chaining
 
-    def test_add_default_authorization_already_set(self):
-        """Test that adding default authorization twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.add_default_authorization()
-        with pytest.raises(ValueError, match="authorization is already set"):
-            builder.add_default_authorization()
-
 
 class TestFormatMethods:
     """Test format related methods."""
 
-    def test_set_format_csv(self):
+    def test_set_format_csv(self, builder):
         """Test setting CSV format."""
-        builder = UnloadQueryBuilder()
         result = builder.set_format("CSV")
         assert builder.options["FORMAT"] == "CSV"
         assert result is builder  # Test method chaining
 
-    def test_set_format_parquet(self):
+    def test_set_format_parquet(self, builder):
         """Test setting PARQUET format."""
-        builder = UnloadQueryBuilder()
         result = builder.set_format("PARQUET")
         assert builder.options["FORMAT"] == "PARQUET"
         assert result is builder  # Test method chaining
 
-    def test_set_format_json(self):
+    def test_set_format_json(self, builder):
         """Test setting JSON format."""
-        builder = UnloadQueryBuilder()
         result = builder.set_format("JSON")
         assert builder.options["FORMAT"] == "JSON"
         assert result is builder  # Test method chaining
 
-    def test_set_format_already_set(self):
-        """Test that setting format twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.set_format("CSV")
-        with pytest.raises(ValueError, match="set_format is already called"):
-            builder.set_format("PARQUET")
+    def test_set_format_lowercase(self, builder):
+        """Test that format is normalized to uppercase."""
+        builder.set_format("parquet")
+        assert builder.options["FORMAT"] == "PARQUET"
+
+    def test_set_format_separate_builders(self, builder):
+        """Test that calls on one builder do not affect another builder."""
+        UnloadQueryBuilder().set_format("CSV")
+        builder.set_format("PARQUET")
+        assert builder.options["FORMAT"] == "PARQUET"
 
 
 class TestPartitionByMethods:
     """Test partition by related methods."""
 
-    def test_set_partition_by_single_column(self):
+    def test_set_partition_by_single_column(self, builder):
         """Test setting partition by single column."""
-        builder = UnloadQueryBuilder()
         result = builder.set_partition_by("year")
         expected = {"columns": ["year"], "include": False}
         assert builder.options["PARTITION_BY"] == expected
         assert result is builder  # Test method chaining
 
-    def test_set_partition_by_multiple_columns(self):
+    def test_set_partition_by_multiple_columns(self, builder):
         """Test setting partition by multiple columns."""
-        builder = UnloadQueryBuilder()
         result = builder.set_partition_by(["year", "month"])
         expected = {"columns": ["year", "month"], "include": False}
         assert builder.options["PARTITION_BY"] == expected
         assert result is builder  # Test method chaining
 
-    def test_set_partition_by_with_include(self):
+    def test_set_partition_by_with_include(self, builder):
         """Test setting partition by with include option."""
-        builder = UnloadQueryBuilder()
         result = builder.set_partition_by(["year", "month"], include=True)
         expected = {"columns": ["year", "month"], "include": True}
         assert builder.options["PARTITION_BY"] == expected
         assert result is builder  # Test method chaining
 
-    def test_set_partition_by_already_set(self):
-        """Test that setting partition by twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.set_partition_by("year")
-        with pytest.raises(ValueError, match="set_partition_by is already called"):
-            builder.set_partition_by("month")
+    def test_set_partition_by_empty_columns(self, builder):
+        """Test that an empty columns list raises error at build time."""
+        builder.add_select_template("SELECT * FROM table")
+        builder.add_to_path("s3://bucket/path/")
+        builder.add_default_authorization()
+        builder.set_partition_by([])
+        with pytest.raises(
+            ValidationError, match="PARTITION_BY columns list cannot be empty"
+        ):
+            builder.build()
+
+    def test_set_partition_by_invalid_include(self, builder):
+        """Test that a non-boolean include raises error at build time."""
+        builder.add_select_template("SELECT * FROM table")
+        builder.add_to_path("s3://bucket/path/")
+        builder.add_default_authorization()
+        builder.set_partition_by(["year"], include="maybe")  # type: ignore
+        with pytest.raises(ValidationError, match="include"):
+            builder.build()
+
+    @pytest.mark.parametrize("validate", [True, False])
+    def test_set_partition_by_input_list_mutated(self, builder, validate):
+        """Test that changing the caller's list does not change built options."""
+        columns = ["year"]
+        builder.add_select_template("SELECT * FROM table")
+        builder.add_to_path("s3://bucket/path/")
+        builder.add_default_authorization()
+        builder.set_partition_by(columns)
+        result = builder.build(validate=validate)
+        columns.append("month")
+        assert result.options.PARTITION_BY.columns == ["year"]  # type: ignore
+        assert "PARTITION BY (year)" in result.query
 
 
 class TestManifestMethods:
     """Test manifest related methods."""
 
-    def test_set_manifest_false(self):
+    def test_set_manifest_false(self, builder):
         """Test setting manifest with verbose=False."""
-        builder = UnloadQueryBuilder()
         result = builder.set_manifest(enable=True, verbose=False)
         assert builder.options["MANIFEST"]["enable"] is True
         assert builder.options["MANIFEST"]["verbose"] is False
         assert result is builder  # Test method chaining
 
-    def test_set_manifest_true(self):
+    def test_set_manifest_true(self, builder):
         """Test setting manifest with verbose=True."""
-        builder = UnloadQueryBuilder()
         result = builder.set_manifest(enable=True, verbose=True)
         assert builder.options["MANIFEST"]["enable"] is True
         assert builder.options["MANIFEST"]["verbose"] is True
         assert result is builder  # Test method chaining
 
-    def test_set_manifest_already_set(self):
-        """Test that setting manifest twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.set_manifest()
-        with pytest.raises(ValueError, match="set_manifest is already called"):
-            builder.set_manifest()
-
 
 class TestHeaderMethods:
     """Test header related methods."""
 
-    def test_set_header_success(self):
+    def test_set_header_success(self, builder):
         """Test setting header."""
-        builder = UnloadQueryBuilder()
         result = builder.set_header()
         assert builder.options["HEADER"] is True
         assert result is builder  # Test method chaining
 
-    def test_set_header_already_set(self):
-        """Test that setting header twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.set_header()
-        with pytest.raises(ValueError, match="set_header is already called"):
-            builder.set_header()
-
 
 class TestCompressionMethods:
     """Test compression related methods."""
 
-    def test_set_compression_gzip(self):
+    def test_set_compression_gzip(self, builder):
         """Test setting GZIP compression."""
-        builder = UnloadQueryBuilder()
         result = builder.set_compression("GZIP")
         assert builder.options["COMPRESSION"] == "GZIP"
         assert result is builder  # Test method chaining
 
-    def test_set_compression_bzip2(self):
+    def test_set_compression_bzip2(self, builder):
         """Test setting BZIP2 compression."""
-        builder = UnloadQueryBuilder()
         result = builder.set_compression("BZIP2")
         assert builder.options["COMPRESSION"] == "BZIP2"
         assert result is builder  # Test method chaining
 
-    def test_set_compression_zstd(self):
+    def test_set_compression_zstd(self, builder):
         """Test setting ZSTD compression."""
-        builder = UnloadQueryBuilder()
         result = builder.set_compression("ZSTD")
         assert builder.options["COMPRESSION"] == "ZSTD"
         assert result is builder  # Test method chaining
 
-    def test_set_compression_already_set(self):
-        """Test that setting compression twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.set_compression("GZIP")
-        with pytest.raises(ValueError, match="set_compression is already called"):
-            builder.set_compression("BZIP2")
+    def test_set_compression_lowercase(self, builder):
+        """Test that compression is normalized to uppercase."""
+        builder.set_compression("gzip")
+        assert builder.options["COMPRESSION"] == "GZIP"
 
-    def test_set_compression_invalid(self):
+    def test_set_compression_invalid(self, builder):
         """Test that setting invalid compression raises error."""
-        builder = UnloadQueryBuilder()
         with pytest.raises(ValueError, match="Invalid compression: INVALID"):
             builder.set_compression("INVALID")
 
+    def test_set_compression_invalid_reports_input(self, builder):
+        """Test that the error shows the value as passed in."""
+        with pytest.raises(ValueError, match="Invalid compression: lzma"):
+            builder.set_compression("lzma")
+
+    def test_set_compression_non_string(self, builder):
+        """Test that a non-string compression raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid compression: None"):
+            builder.set_compression(None)  # type: ignore
+
+    def test_set_compression_after_invalid(self, builder):
+        """Test that a rejected compression does not count as already set."""
+        with pytest.raises(ValueError, match="Invalid compression: INVALID"):
+            builder.set_compression("INVALID")
+        builder.set_compression("GZIP")
+        assert builder.options["COMPRESSION"] == "GZIP"
+
 
 class TestDelimiterMethods:
     """Test delimiter related methods."""
 
-    def test_set_delimiter_success(self):
+    def test_set_delimiter_success(self, builder):
         """Test setting delimiter."""
-        builder = UnloadQueryBuilder()
         result = builder.set_delimiter(",")
         assert builder.options["DELIMITER"] == ","
         assert result is builder  # Test method chaining
 
-    def test_set_delimiter_already_set(self):
-        """Test that setting delimiter twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.set_delimiter(",")
-        with pytest.raises(ValueError, match="set_delimiter is already called"):
-            builder.set_delimiter("|")
-
 
 class TestFixedwidthMethods:
     """Test fixedwidth related methods."""
 
-    def test_set_fixedwidth_success(self):
+    def test_set_fixedwidth_success(self, builder):
         """Test setting fixedwidth."""
-        builder = UnloadQueryBuilder()
         result = builder.set_fixedwidth("1:10,2:20")
         assert builder.options["FIXEDWIDTH"] == "1:10,2:20"
         assert result is builder  # Test method chaining
 
-    def test_set_fixedwidth_already_set(self):
-        """Test that setting fixedwidth twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.set_fixedwidth("1:10,2:20")
-        with pytest.raises(ValueError, match="set_fixedwidth is already called"):
-            builder.set_fixedwidth("3:15,4:25")
-
 
 class TestEncryptedMethods:
     """Test encrypted related methods."""
 
-    def test_set_encrypted_false(self):
+    def test_set_encrypted_false(self, builder):
         """Test setting encrypted with enable=False."""
-        builder = UnloadQueryBuilder()
         result = builder.set_encrypted(enable=False)
         assert builder.options["ENCRYPTED"] is False
         assert result is builder  # Test method chaining
 
-    def test_set_encrypted_true(self):
+    def test_set_encrypted_true(self, builder):
         """Test setting encrypted with enable=True."""
-        builder = UnloadQueryBuilder()
         result = builder.set_encrypted(enable=True)
         assert builder.options["ENCRYPTED"] is True
         assert result is builder  # Test method chaining
 
-    def test_set_encrypted_already_set(self):
-        """Test that setting encrypted twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.set_encrypted()
-        with pytest.raises(ValueError, match="set_encrypted is already called"):
-            builder.set_encrypted()
-
 
 class TestAddquotesMethods:
     """Test addquotes related methods."""
 
-    def test_set_addquotes_success(self):
+    def test_set_addquotes_success(self, builder):
         """Test setting addquotes."""
-        builder = UnloadQueryBuilder()
         result = builder.set_addquotes()
         assert builder.options["ADDQUOTES"] is True
         assert result is builder  # Test method chaining
 
-    def test_set_addquotes_already_set(self):
-        """Test that setting addquotes twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.set_addquotes()
-        with pytest.raises(ValueError, match="set_addquotes is already called"):
-            builder.set_addquotes()
-
 
 class TestNullMethods:
     """Test null related methods."""
 
-    def test_set_null_as_success(self):
+    def test_set_null_as_success(self, builder):
         """Test setting null as."""
-        builder = UnloadQueryBuilder()
         result = builder.set_null("NULL")
         assert builder.options["NULL"] == "NULL"
         assert result is builder  # Test method chaining
 
-    def test_set_null_as_already_set(self):
-        """Test that setting null as twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.set_null("NULL")
-        with pytest.raises(ValueError, match="set_null is already called"):
-            builder.set_null("EMPTY")
-
 
 class TestEscapeMethods:
     """Test escape related methods."""
 
-    def test_set_escape_success(self):
+    def test_set_escape_success(self, builder):
         """Test setting escape."""
-        builder = UnloadQueryBuilder()
         result = builder.set_escape()
         assert builder.options["ESCAPE"] is True
         assert result is builder  # Test method chaining
 
-    def test_set_escape_already_set(self):
-        """Test that setting escape twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.set_escape()
-        with pytest.raises(ValueError, match="set_escape is already called"):
-            builder.set_escape()
-
 
 class TestAllowoverwriteMethods:
     """Test allowoverwrite related methods."""
 
-    def test_set_allowoverwrite_success(self):
+    def test_set_allowoverwrite_success(self, builder):
         """Test setting allowoverwrite."""
-        builder = UnloadQueryBuilder()
         result = builder.set_allowoverwrite()
         assert builder.options["ALLOWOVERWRITE"] is True
         assert result is builder  # Test method chaining
 
-    def test_set_allowoverwrite_already_set(self):
-        """Test that setting allowoverwrite twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.set_allowoverwrite()
-        with pytest.raises(ValueError, match="set_allowoverwrite is already called"):
-            builder.set_allowoverwrite()
-
 
 class TestCleanpathMethods:
     """Test cleanpath related methods."""
 
-    def test_set_cleanpath_success(self):
+    def test_set_cleanpath_success(self, builder):
         """Test setting cleanpath."""
-        builder = UnloadQueryBuilder()
         result = builder.set_cleanpath()
         assert builder.options["CLEANPATH"] is True
         assert result is builder  # Test method chaining
 
-    def test_set_cleanpath_already_set(self):
-        """Test that setting cleanpath twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.set_cleanpath()
-        with pytest.raises(ValueError, match="set_cleanpath is already called"):
-            builder.set_cleanpath()
-
 
 class TestParallelMethods:
     """Test parallel related methods."""
 
-    def test_set_parallel_boolean_true(self):
+    def test_set_parallel_boolean_true(self, builder):
         """Test setting parallel with boolean True."""
-        builder = UnloadQueryBuilder()
         result = builder.set_parallel(True)
         assert builder.options["PARALLEL"] == "ON"
         assert result is builder  # Test method chaining
 
-    def test_set_parallel_boolean_false(self):
+    def test_set_parallel_boolean_false(self, builder):
         """Test setting parallel with boolean False."""
-        builder = UnloadQueryBuilder()
         result = builder.set_parallel(False)
         assert builder.options["PARALLEL"] == "OFF"
         assert result is builder  # Test method chaining
 
-    def test_set_parallel_string_on(self):
+    def test_set_parallel_string_on(self, builder):
         """Test setting parallel with string 'ON'."""
-        builder = UnloadQueryBuilder()
         result = builder.set_parallel("ON")
         assert builder.options["PARALLEL"] == "ON"
         assert result is builder  # Test method chaining
 
-    def test_set_parallel_string_off(self):
+    def test_set_parallel_string_off(self, builder):
         """Test setting parallel with string 'OFF'."""
-        builder = UnloadQueryBuilder()
         result = builder.set_parallel("OFF")
         assert builder.options["PARALLEL"] == "OFF"
         assert result is builder  # Test method chaining
 
-    def test_set_parallel_string_true(self):
+    def test_set_parallel_string_true(self, builder):
         """Test setting parallel with string 'TRUE'."""
-        builder = UnloadQueryBuilder()
         result = builder.set_parallel("TRUE")
         assert builder.options["PARALLEL"] == "ON"
         assert result is builder  # Test method chaining
 
-    def test_set_parallel_string_false(self):
+    def test_set_parallel_string_false(self, builder):
         """Test setting parallel with string 'FALSE'."""
-        builder = UnloadQueryBuilder()
         result = builder.set_parallel("FALSE")
         assert builder.options["PARALLEL"] == "OFF"
         assert result is builder  # Test method chaining
 
-    def test_set_parallel_invalid(self):
+    def test_set_parallel_invalid(self, builder):
         """Test that setting invalid parallel raises error."""
-        builder = UnloadQueryBuilder()
         with pytest.raises(ValueError, match="Invalid parallel value: INVALID"):
             builder.set_parallel("INVALID")
 
-    def test_set_parallel_already_set(self):
-        """Test that setting parallel twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.set_parallel(True)
-        with pytest.raises(ValueError, match="set_parallel is already called"):
-            builder.set_parallel(False)
-
 
 class TestMaxfilesizeMethods:
     """Test maxfilesize related methods."""
 
-    def test_set_maxfilesize_success(self):
+    def test_set_maxfilesize_success(self, builder):
         """Test setting maxfilesize."""
-        builder = UnloadQueryBuilder()
         result = builder.set_maxfilesize("100 MB")
         assert builder.options["MAXFILESIZE"] == "100 MB"
         assert result is builder  # Test method chaining
 
-    def test_set_maxfilesize_already_set(self):
-        """Test that setting maxfilesize twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.set_maxfilesize("100 MB")
-        with pytest.raises(ValueError, match="set_maxfilesize is already called"):
-            builder.set_maxfilesize("200 MB")
-
 
 class TestRowgroupsizeMethods:
     """Test rowgroupsize related methods."""
 
-    def test_set_rowgroupsize_success(self):
+    def test_set_rowgroupsize_success(self, builder):
         """Test setting rowgroupsize."""
-        builder = UnloadQueryBuilder()
         result = builder.set_rowgroupsize("64 MB")
         assert builder.options["ROWGROUPSIZE"] == "64 MB"
         assert result is builder  # Test method chaining
 
-    def test_set_rowgroupsize_already_set(self):
-        """Test that setting rowgroupsize twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.set_rowgroupsize("64 MB")
-        with pytest.raises(ValueError, match="set_rowgroupsize is already called"):
-            builder.set_rowgroupsize("128 MB")
-
 
 class TestRegionMethods:
     """Test region related methods."""
 
-    def test_set_region_success(self):
+    def test_set_region_success(self, builder):
         """Test setting region."""
-        builder = UnloadQueryBuilder()
         result = builder.set_region("us-east-1")
         assert builder.options["REGION"] == "us-east-1"
         assert result is builder  # Test method chaining
 
-    def test_set_region_already_set(self):
-        """Test that setting region twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.set_region("us-east-1")
-        with pytest.raises(ValueError, match="set_region is already called"):
-            builder.set_region("us-west-2")
-
 
 class TestExtensionMethods:
     """Test extension related methods."""
 
-    def test_set_extension_success(self):
+    def test_set_extension_success(self, builder):
         """Test setting extension."""
-        builder = UnloadQueryBuilder()
         result = builder.set_extension("csv")
         assert builder.options["EXTENSION"] == "csv"
         assert result is builder  # Test method chaining
 
-    def test_set_extension_already_set(self):
-        """Test that setting extension twice raises error."""
-        builder = UnloadQueryBuilder()
-        builder.set_extension("csv")
-        with pytest.raises(ValueError, match="set_extension is already called"):
-            builder.set_extension("json")
-
 
 class TestBuildMethod:
     """Test the build method."""
 
-    def test_build_success(self):
+    def test_build_success(self, builder):
         """Test successful build with all required fields."""
-        builder = UnloadQueryBuilder()
         builder.add_select_template("SELECT * FROM table")
         builder.add_select_params({"date": "2024-01-01"})
         builder.add_to_path("s3://bucket/path/")
@@ -567,9 +447,50 @@ class TestBuildMethod:
         assert result.authorization == "IAM_ROLE default"
         assert result.options.FORMAT == "CSV"
 
-    def test_build_missing_select_template(self):
+    def test_build_without_options(self, builder):
+        """Test that build without options uses the shared default options."""
+        builder.add_select_template("SELECT * FROM table")
+        builder.add_to_path("s3://bucket/path/")
+        builder.add_default_authorization()
+
+        result = builder.build()
+        assert result.options is UnloadQueryOption.default()
+
+    def test_build_without_validation(self):
+        """Test that build(validate=False) renders the same query."""
+
+        def make_builder():
+            return (
+                UnloadQueryBuilder()
+                .add_select_template("SELECT * FROM table")
+                .add_to_path("s3://bucket/path/")
+                .add_default_authorization()
+                .set_format("parquet")
+                .set_partition_by(["year", "month"], include=True)
+                .set_manifest(verbose=True)
+                .set_parallel("OFF")
+                .set_maxfilesize("100 MB")
+            )
+
+        unchecked = make_builder().build(validate=False)
+        assert unchecked.options.FORMAT == "PARQUET"
+        assert unchecked.options.PARALLEL is False
+        assert unchecked.query == make_builder().build().query
+
+    def test_build_without_validation_skips_conflict_rules(self, builder):
+        """Test that build(validate=False) does not check conflicting options."""
+        builder.add_select_template("SELECT * FROM table")
+        builder.add_to_path("s3://bucket/path/")
+        builder.add_default_authorization()
+        builder.set_cleanpath()
+        builder.set_allowoverwrite()
+
+        result = builder.build(validate=False)
+        assert result.options.CLEANPATH is True
+        assert result.options.ALLOWOVERWRITE is True
+
+    def test_build_missing_select_template(self, builder):
         """Test that build fails when select_template is missing."""
-        builder = UnloadQueryBuilder()
         builder.add_select_params({"date": "2024-01-01"})
         builder.add_to_path("s3://bucket/path/")
         builder.add_default_authorization()
@@ -577,9 +498,8 @@ class TestBuildMethod:
         with pytest.raises(AssertionError):
             builder.build()
 
-    def test_build_missing_to_path(self):
+    def test_build_missing_to_path(self, builder):
         """Test that build fails when to_path is missing."""
-        builder = UnloadQueryBuilder()
         builder.add_select_template("SELECT * FROM table")
         builder.add_select_params({"date": "2024-01-01"})
         builder.add_default_authorization()
@@ -587,9 +507,8 @@ class TestBuildMethod:
         with pytest.raises(AssertionError):
             builder.build()
 
-    def test_build_missing_authorization(self):
+    def test_build_missing_authorization(self, builder):
         """Test that build fails when authorization is missing."""
-        builder = UnloadQueryBuilder()
         builder.add_select_template("SELECT * FROM table")
         builder.add_select_params({"date": "2024-01-01"})
         builder.add_to_path("s3://bucket/path/")
@@ -603,14 +522,12 @@ class TestUnloadQueryAndParams:
 
     def test_query_property(self):
         """Test the query property."""
-        from redshift_query_builder.core import UnloadQueryOption
-
         query_and_params = UnloadQueryAndParams(
             select_template="SELECT * FROM table",
             select_params={"date": "2024-01-01"},
             to_path="s3://bucket/path/",
             authorization="IAM_ROLE default",
-            options=UnloadQueryOption(FORMAT="CSV"),
+            options=CSV_OPTIONS,
         )
 
         expected_query = "UNLOAD ('SELECT * FROM table') TO 's3://bucket/path/'\nIAM_ROLE default\nFORMAT AS CSV\nPARALLEL OFF"
@@ -618,15 +535,74 @@ class TestUnloadQueryAndParams:
 
     def test_params_property(self):
         """Test the params property."""
-        from redshift_query_builder.core import UnloadQueryOption
-
         params = {"date": "2024-01-01"}
         query_and_params = UnloadQueryAndParams(
             select_template="SELECT * FROM table",
             select_params=params,
             to_path="s3://bucket/path/",
             authorization="IAM_ROLE default",
-            options=UnloadQueryOption(),
+            options=EMPTY_OPTIONS,
         )
 
         assert query_and_params.params == params
+
+
+# (method, first call args, second call args, expected error)
+ALREADY_CALLED_CASES = [
+    (
+        "add_select_template",
+        ("SELECT * FROM table",),
+        ("SELECT * FROM another_table",),
+        "add_select_template is already called",
+    ),
+    (
+        "add_select_params",
+        ({"date": "2024-01-01"},),
+        ({"date": "2024-01-02"},),
+        "add_select_params is already called",
+    ),
+    (
+        "add_to_path",
+        ("s3://bucket/path/",),
+        ("s3://another-bucket/path/",),
+        "add_to_path is already called",
+    ),
+    (
+        "add_iam_role_authorization",
+        (("123456789012", "MyRole"),),
+        (("987654321098", "AnotherRole"),),
+        "authorization is already set",
+    ),
+    ("add_default_authorization", (), (), "authorization is already set"),
+    ("set_format", ("CSV",), ("PARQUET",), "set_format is already called"),
+    ("set_partition_by", ("year",), ("month",), "set_partition_by is already called"),
+    ("set_manifest", (), (), "set_manifest is already called"),
+    ("set_header", (), (), "set_header is already called"),
+    ("set_compression", ("GZIP",), ("BZIP2",), "set_compression is already called"),
+    ("set_delimiter", (",",), ("|",), "set_delimiter is already called"),
+    (
+        "set_fixedwidth",
+        ("1:10,2:20",),
+        ("3:15,4:25",),
+        "set_fixedwidth is already called",
+    ),
+    ("set_encrypted", (), (), "set_encrypted is already called"),
+    ("set_addquotes", (), (), "set_addquotes is already called"),
+    ("set_null", ("NULL",), ("EMPTY",), "set_null is already called"),
+    ("set_escape", (), (), "set_escape is already called"),
+    ("set_allowoverwrite", (), (), "set_allowoverwrite is already called"),
+    ("set_cleanpath", (), (), "set_cleanpath is already called"),
+    ("set_parallel", (True,), (False,), "set_parallel is already called"),
+    ("set_maxfilesize", ("100 MB",), ("200 MB",), "set_maxfilesize is already called"),
+    ("set_rowgroupsize", ("64 MB",), ("128 MB",), "set_rowgroupsize is already called"),
+    ("set_region", ("us-east-1",), ("us-west-2",), "set_region is already called"),
+    ("set_extension", ("csv",), ("json",), "set_extension is already called"),
+]
+
+
+@pytest.mark.parametrize("method,first_args,second_args,message", ALREADY_CALLED_CASES)
+def test_method_already_called(builder, method, first_args, second_args, message):
+    """Test that calling a builder method twice raises error."""
+    getattr(builder, method)(*first_args)
+    with pytest.raises(ValueError, match=message):
+        getattr(builder, method)(*second_args)
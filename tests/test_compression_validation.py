@@ -1,68 +1,38 @@
 #!/usr/bin/env python3
 
+import pytest
 from pydantic import ValidationError
 
 from redshift_query_builder.core import UnloadQueryOption
 
 
-def test_compression_validation():
-    """Test that COMPRESSION field validates correctly with Literal type."""
+@pytest.mark.parametrize("compression", ["GZIP", "BZIP2", "ZSTD"])
+def test_valid_compression(compression):
+    """Test that supported compression values are accepted."""
+    assert UnloadQueryOption(COMPRESSION=compression).COMPRESSION == compression
 
-    # Test valid compression values (uppercase)
-    print("Testing valid compression values (uppercase)...")
-    valid_options = [
-        {"COMPRESSION": "GZIP"},
-        {"COMPRESSION": "BZIP2"},
-        {"COMPRESSION": "ZSTD"},
-    ]
 
-    for option in valid_options:
-        try:
-            unload_option = UnloadQueryOption(**option)
-            print(f"✓ Valid: {option['COMPRESSION']}")
-        except ValidationError as e:
-            print(f"✗ Unexpected error for {option['COMPRESSION']}: {e}")
+@pytest.mark.parametrize("compression", ["gzip", "bzip2", "zstd"])
+def test_lowercase_compression(compression):
+    """Test that lowercase compression values are rejected by the model.
 
-    # Test valid compression values (lowercase - should be converted to uppercase)
-    print("\nTesting valid compression values (lowercase - should be converted)...")
-    lowercase_options = [
-        {"COMPRESSION": "gzip"},
-        {"COMPRESSION": "bzip2"},
-        {"COMPRESSION": "zstd"},
-    ]
+    Only UnloadQueryBuilder.set_compression() normalizes the case.
+    """
+    with pytest.raises(
+        ValidationError, match="Input should be 'GZIP', 'BZIP2' or 'ZSTD'"
+    ):
+        UnloadQueryOption(COMPRESSION=compression)
 
-    for option in lowercase_options:
-        try:
-            unload_option = UnloadQueryOption(**option)
-            print(
-                f"✓ Valid (converted): {option['COMPRESSION']} -> {unload_option.COMPRESSION}"
-            )
-        except ValidationError as e:
-            print(f"✗ Unexpected error for {option['COMPRESSION']}: {e}")
 
-    # Test invalid compression values
-    print("\nTesting invalid compression values...")
-    invalid_options = [
-        {"COMPRESSION": "LZMA"},  # not supported
-        {"COMPRESSION": "NONE"},  # not supported
-        {"COMPRESSION": "COMPRESS"},  # not supported
-    ]
+@pytest.mark.parametrize("compression", ["LZMA", "NONE", "COMPRESS"])
+def test_invalid_compression(compression):
+    """Test that unsupported compression values are rejected."""
+    with pytest.raises(
+        ValidationError, match="Input should be 'GZIP', 'BZIP2' or 'ZSTD'"
+    ):
+        UnloadQueryOption(COMPRESSION=compression)
 
-    for option in invalid_options:
-        try:
-            unload_option = UnloadQueryOption(**option)
-            print(f"✗ Should have failed for {option['COMPRESSION']}")
-        except ValidationError as e:
-            print(f"✓ Correctly rejected {option['COMPRESSION']}: {e}")
 
-    # Test None value (should be valid)
-    print("\nTesting None value...")
-    try:
-        unload_option = UnloadQueryOption(COMPRESSION=None)
-        print("✓ None value is valid")
-    except ValidationError as e:
-        print(f"✗ None value should be valid: {e}")
-
-
-if __name__ == "__main__":
-    test_compression_validation()
+def test_none_compression():
+    """Test that COMPRESSION can be None."""
+    assert UnloadQueryOption(COMPRESSION=None).COMPRESSION is None
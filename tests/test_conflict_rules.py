@@ -5,32 +5,21 @@ import pytest
 
 from redshift_query_builder.core import UnloadQueryOption
 
-
-def test_cleanpath_allowoverwrite_conflict():
-    """Test CLEANPATH and ALLOWOVERWRITE conflict."""
-    with pytest.raises(
-        ValueError,
-        match="Conflicting options cannot be used together: ALLOWOVERWRITE, CLEANPATH",
-    ):
-        UnloadQueryOption(CLEANPATH=True, ALLOWOVERWRITE=True)
-
-
-def test_fixedwidth_delimiter_conflict():
-    """Test FIXEDWIDTH and DELIMITER conflict."""
-    with pytest.raises(
-        ValueError,
-        match="Conflicting options cannot be used together: DELIMITER, FIXEDWIDTH",
-    ):
-        UnloadQueryOption(FIXEDWIDTH="0:10,1:20", DELIMITER=",")
+# (options, conflicting option names as listed in the error)
+CONFLICTS = [
+    ({"CLEANPATH": True, "ALLOWOVERWRITE": True}, "ALLOWOVERWRITE, CLEANPATH"),
+    ({"FIXEDWIDTH": "0:10,1:20", "DELIMITER": ","}, "DELIMITER, FIXEDWIDTH"),
+    ({"FIXEDWIDTH": "0:10,1:20", "HEADER": True}, "FIXEDWIDTH, HEADER"),
+]
 
 
-def test_fixedwidth_header_conflict():
-    """Test FIXEDWIDTH and HEADER conflict."""
+@pytest.mark.parametrize("options,names", CONFLICTS)
+def test_conflict(options, names):
+    """Test that each pair of conflicting options raises error."""
     with pytest.raises(
-        ValueError,
-        match="Conflicting options cannot be used together: FIXEDWIDTH, HEADER",
+        ValueError, match=f"Conflicting options cannot be used together: {names}"
     ):
-        UnloadQueryOption(FIXEDWIDTH="0:10,1:20", HEADER=True)
+        UnloadQueryOption(**options)
 
 
 def test_valid_combination():